@@ -1,14 +1,55 @@
 from flask import Flask, request, render_template, jsonify
-import os
+from flask.json.provider import JSONProvider
+import hashlib
+from collections import OrderedDict
+from threading import Lock
 from typing import Tuple
-import pandas as pd
 import numpy as np
+import orjson
+import pyarrow as pa
+import pyarrow.csv as pac
 from numpy.typing import NDArray
+from numba import njit, prange, types
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Serializes JSON responses with orjson, which is faster than the standard
+    library, handles NumPy scalars natively, and writes NaN and infinity as
+    null instead of producing invalid JSON.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
+# Kernels are compiled eagerly at import for these array types so the first
+# request doesn't pay for JIT compilation. Prices are contiguous float32, and
+# may be read-only views of the parsed Arrow buffers.
+PRICE_ARRAY_TYPES = (
+    types.Array(types.float32, 1, "C"),
+    types.Array(types.float32, 1, "C", readonly=True),
+)
 
-def load_stock_data_from_file(file_obj, max_days: int = 365) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+# Metrics of recently uploaded files, keyed by a digest of their contents
+# and evicted least recently used first.
+METRICS_CACHE_SIZE = 256
+metrics_cache: "OrderedDict[bytes, dict]" = OrderedDict()
+metrics_cache_lock = Lock()
+
+# Serializes calls to the parallel compute_batch kernel across request
+# threads. Numba's fallback workqueue threading layer aborts the process if
+# two threads enter a parallel region at the same time.
+compute_batch_lock = Lock()
+
+
+def load_stock_data_from_file(file_obj, max_days: int = 365) -> Tuple[NDArray[np.float32], NDArray[np.float32]]:
     """
     Reads a CSV file-like object, extracts closing prices and volumes, and
     returns the last max_days entries.
@@ -18,197 +59,420 @@ def load_stock_data_from_file(file_obj, max_days: int = 365) -> Tuple[NDArray[np
         max_days (int): Maximum number of days to return from the end.
 
     Returns:
-        Tuple (NDArray[np.float64], NDArray[np.float64]): A tuple containing:
+        Tuple (NDArray[np.float32], NDArray[np.float32]): A tuple containing:
             - closing prices array of length up to max_days.
             - volume array of length up to max_days.
 
     Raises:
-        RuntimeError: If an error occurs reading the CSV.
-        ValueError: If required columns are missing or no valid data found.
+        RuntimeError: If an error occurs reading the CSV, including
+            non-numeric 'Close' and 'Volume' values. Rows missing only the
+            Volume field keep their closing price; other rows that don't have
+            six columns are skipped.
+        ValueError: If fewer than two valid closing prices are found.
     """
+    # Arrow can't parse rows with a different number of fields, so they are
+    # skipped. Rows missing only Volume still carry a closing price, which is
+    # kept along with its position among the parsed rows so it can be spliced
+    # back in order. Empty lines are parsed as all-null rows and single
+    # threaded parsing keeps line numbers known, so a row's position is its
+    # line number less the skipped rows before it.
+    short_closes = []
+    skipped_rows = 0
+
+    def handle_invalid_row(row) -> str:
+        nonlocal skipped_rows
+        if row.actual_columns == 5:
+            short_closes.append((row.number - 1 - skipped_rows, row.text.split(",")[4].strip()))
+        skipped_rows += 1
+        return "skip"
+
+    # Only Close and Volume are converted; Arrow's parser skips the other
+    # columns and releases the GIL while parsing.
     try:
-        df = pd.read_csv(
+        table = pac.read_csv(
             file_obj,
-            names=["Date", "Open", "High", "Low", "Close", "Volume"],
+            read_options=pac.ReadOptions(
+                column_names=["Date", "Open", "High", "Low", "Close", "Volume"],
+                use_threads=False,
+            ),
+            parse_options=pac.ParseOptions(invalid_row_handler=handle_invalid_row, ignore_empty_lines=False),
+            convert_options=pac.ConvertOptions(
+                include_columns=["Close", "Volume"],
+                column_types={"Close": pa.float32(), "Volume": pa.float32()},
+            ),
         )
+        if short_closes:
+            null_values = set(pac.ConvertOptions().null_values)
+            positions = [position for position, text in short_closes if text not in null_values]
+            values = [float(text) for _, text in short_closes if text not in null_values]
     except Exception as e:
         raise RuntimeError(f"Error reading CSV: {e}")
 
-    if "Close" not in df.columns or "Volume" not in df.columns:
-        raise ValueError("CSV file must contain 'Close' and 'Volume' columns.")
-
-    closing = df["Close"].dropna().values[-max_days:]
-    volume = df["Volume"].dropna().values[-max_days:]
+    if short_closes:
+        closing = np.insert(table["Close"].to_numpy(zero_copy_only=False), positions, values)
+        closing = closing[~np.isnan(closing)][-max_days:]
+    else:
+        closing = table["Close"].drop_null().to_numpy()[-max_days:]
+    volume = table["Volume"].drop_null().to_numpy()[-max_days:]
     if closing.size == 0:
         raise ValueError("No valid closing price data found.")
+    if closing.size < 2:
+        raise ValueError("At least two closing prices are required.")
 
+    # The kernels are compiled for C-contiguous arrays only; this is a no-op
+    # unless Arrow had to hand back a strided or differently typed array.
     return (
-        np.array(closing, dtype=np.float64),
-        np.array(volume, dtype=np.float64),
+        np.ascontiguousarray(closing, dtype=np.float32),
+        np.ascontiguousarray(volume, dtype=np.float32),
     )
 
 
-def compute_standard_deviation(prices: NDArray[np.float64]) -> float:
+@njit(
+    [
+        types.Tuple((types.float64, types.int64, *[types.float64] * 5))(array, types.float64)
+        for array in PRICE_ARRAY_TYPES
+    ],
+    cache=True,
+    fastmath={"reassoc", "contract", "arcp"},
+    nogil=True,
+    error_model="numpy",
+)
+def compute_all(prices: NDArray[np.float32], delta_percent: float) -> Tuple[float, int, float, float, float, float, float]:
     """
-    Computes standard deviation of prices as a percentage of the mean price.
+    Computes all price/return based metrics in a single pass over the prices.
 
     Args:
-        prices (NDArray[np.float64]): Array of closing prices.
+        prices (NDArray[np.float32]): Array of closing prices.
+        delta_percent (float): Threshold percent change to count as a large change.
 
     Returns:
-        float: Standard deviation expressed in percent of mean.
+        Tuple (float, int, float, float, float, float, float): A tuple containing:
+            - standard deviation of prices in percent of the mean price.
+            - number of days where the absolute daily change exceeded delta_percent.
+            - average daily return in percent.
+            - annualized volatility of daily returns in percent.
+            - Sharpe ratio (assuming a zero risk-free rate).
+            - maximum drawdown in percent.
+            - percent of days with positive returns.
     """
-    mean_price = np.mean(prices)
-    std_dev = np.std(prices)
-    return float((std_dev / mean_price) * 100)
-
-def detect_large_changes(prices: NDArray[np.float64], delta_percent: float = 10.0) -> int:
-    """
-    Counts days where absolute daily change exceeds a given percentage.
-
-    Args:
-        prices (NDArray[np.float64]): Array of closing prices.
-        delta_percent (float): Threshold percent change to count.
+    n = prices.shape[0]
+    n_rets = n - 1
+
+    # Prices are shifted by the first price so the variance of a
+    # high-priced series doesn't lose precision in E[x^2] - E[x]^2.
+    shift = np.float64(prices[0])
+    threshold = delta_percent / 100.0
+    sum_p = 0.0
+    sum_p2 = 0.0
+    sum_r = 0.0
+    sum_r2 = 0.0
+    large_changes = 0
+    pos_days = 0
+    peak = 0.0
+    max_drop = 0.0
+    for i in range(1, n):
+        # Inputs are float32, but all arithmetic is carried out in float64.
+        price = np.float64(prices[i])
+        x = price - shift
+        sum_p += x
+        sum_p2 += x * x
+
+        # The counts only need the sign and size of the price change, so
+        # they compare against the previous price instead of dividing.
+        prev = np.float64(prices[i - 1])
+        diff = price - prev
+        pos_days += diff > 0.0
+        large_changes += abs(diff) > threshold * prev
+
+        r = diff / prev
+        sum_r += r
+        sum_r2 += r * r
+
+        # Cumulative growth is prices[i] / prices[0], so drawdowns are
+        # tracked on raw prices and scaled by the first price at the end.
+        if price > peak:
+            peak = price
+        elif peak - price > max_drop:
+            max_drop = peak - price
+
+    mean_p = sum_p / n
+    std_p = np.sqrt(max(sum_p2 / n - mean_p * mean_p, 0.0))
+    mean_r = sum_r / n_rets
+    std_r = np.sqrt(max(sum_r2 / n_rets - mean_r * mean_r, 0.0))
+    sharpe = mean_r / std_r * np.sqrt(252.0) if std_r > 0.0 else np.nan
 
-    Returns:
-        int: Number of days with large changes.
-    """
-    changes = np.abs(np.diff(prices)) / prices[:-1] * 100
-    return int((changes > delta_percent).sum())
+    return (
+        std_p / (mean_p + shift) * 100.0,
+        large_changes,
+        mean_r * 100.0,
+        std_r * np.sqrt(252.0) * 100.0,
+        sharpe,
+        max_drop / shift * 100.0,
+        pos_days / n_rets * 100.0,
+    )
 
-def compute_avg_daily_return(prices: NDArray[np.float64]) -> float:
+def compute_moving_average(prices: NDArray[np.float32], window: int = 20) -> float:
     """
-    Computes the average daily return as a percentage.
+    Computes a simple moving average of the closing prices.
 
     Args:
-        prices (NDArray[np.float64]): Array of closing prices.
+        prices (NDArray[np.float32]): Array of closing prices.
+        window (int): Number of days for the moving average.
 
     Returns:
-        float: Average daily return in percent.
+        float: Last value of the moving average, or NaN if there are fewer
+            than window prices.
     """
-    rets = np.diff(prices) / prices[:-1]
-    return float(np.mean(rets) * 100)
-
-def compute_annualized_volatility(prices: NDArray[np.float64]) -> float:
+    if prices.size < window:
+        return float("nan")
+    return float(prices[-window:].mean(dtype=np.float64))
+
+@njit(
+    [types.float64(array, types.int64, types.int64) for array in PRICE_ARRAY_TYPES],
+    cache=True,
+    nogil=True,
+    error_model="numpy",
+)
+def compute_bollinger_pctB(prices: NDArray[np.float32], window: int, n_std: int) -> float:
     """
-    Computes the annualized volatility (standard deviation) of daily returns.
+    Calculates the Bollinger %B indicator for the last price.
 
     Args:
-        prices (NDArray[np.float64]): Array of closing prices.
+        prices (NDArray[np.float32]): Array of closing prices.
+        window (int): Number of days for the moving average and std.
+        n_std (int): Number of standard deviations for the bands.
 
     Returns:
-        float: Annualized volatility in percent.
+        float: Bollinger %B for the latest price, or NaN if there are fewer
+            than window prices.
     """
-    rets = np.diff(prices) / prices[:-1]
-    vol_daily = np.std(rets)
-    return float(vol_daily * np.sqrt(252) * 100)
-
-def compute_sharpe_ratio(prices: NDArray[np.float64]) -> float:
+    n = prices.shape[0]
+    if n < window:
+        return np.nan
+
+    # Welford's algorithm gives the mean and variance of the window in one pass.
+    mid = 0.0
+    m2 = 0.0
+    for k in range(1, window + 1):
+        x = np.float64(prices[n - window + k - 1])
+        delta = x - mid
+        mid += delta / k
+        m2 += delta * (x - mid)
+    sd = np.sqrt(m2 / (window - 1))
+
+    if sd == 0.0:
+        return np.nan
+    lower = mid - n_std * sd
+    return (prices[-1] - lower) / (2 * n_std * sd)
+
+@njit(
+    [types.float64(array, types.int64) for array in PRICE_ARRAY_TYPES],
+    cache=True,
+    nogil=True,
+    error_model="numpy",
+)
+def compute_rsi(prices: NDArray[np.float32], window: int) -> float:
     """
-    Computes a Sharpe-like ratio (risk-adjusted return) assuming zero risk-free rate.
+    Computes the Relative Strength Index (RSI) for the last price.
 
     Args:
-        prices (NDArray[np.float64]): Array of closing prices.
+        prices (NDArray[np.float32]): Array of closing prices.
+        window (int): Number of days for RSI calculation.
 
     Returns:
-        float: Sharpe ratio.
+        float: RSI value for the latest price.
     """
-    rets = np.diff(prices) / prices[:-1]
-    return float((np.mean(rets) / np.std(rets)) * np.sqrt(252))
-
-def compute_max_drawdown(prices: NDArray[np.float64]) -> float:
+    # Gains and losses are smoothed with the same exponential weights, so
+    # the normalizing sum of weights cancels out of their ratio.
+    decay = 1.0 - 1.0 / window
+    gain = 0.0
+    loss = 0.0
+    for i in range(1, prices.shape[0]):
+        delta = np.float64(prices[i]) - np.float64(prices[i - 1])
+        gain *= decay
+        loss *= decay
+        if delta > 0.0:
+            gain += delta
+        else:
+            loss -= delta
+
+    if loss == 0.0:
+        return 100.0 if gain > 0.0 else np.nan
+    return 100.0 - 100.0 / (1.0 + gain / loss)
+
+def compute_volume_spikes(volumes: NDArray[np.float32], threshold: float = 2.0) -> int:
     """
-    Calculates the maximum drawdown (peak-to-trough decline) in percent.
+    Counts days where trading volume exceeds a threshold times the average.
 
     Args:
-        prices (NDArray[np.float64]): Array of closing prices.
+        volumes (NDArray[np.float32]): Array of daily volume values.
+        threshold (float): Multiplier of average volume for a spike.
 
     Returns:
-        float: Maximum drawdown in percent.
-    """
-    rets = np.diff(prices) / prices[:-1]
-    cum = np.cumprod(1 + rets) - 1
-    peak = np.maximum.accumulate(cum)
-    drawdowns = peak - cum
-    return float(np.max(drawdowns) * 100)
-
-def compute_percent_positive_days(prices: NDArray[np.float64]) -> float:
+        int: Number of volume spike days.
     """
-    Calculates the percentage of days with positive returns.
+    avg_vol = volumes.mean(dtype=np.float64)
+    return int(np.count_nonzero(volumes > threshold * avg_vol))
 
-    Args:
-        prices (NDArray[np.float64]): Array of closing prices.
 
-    Returns:
-        float: Percent of days with positive returns.
+@njit(
+    types.float64[:, ::1](types.float32[:, ::1], types.int64[::1]),
+    cache=True,
+    parallel=True,
+)
+def compute_batch(prices: NDArray[np.float32], lengths: NDArray[np.int64]) -> NDArray[np.float64]:
     """
-    rets = np.diff(prices) / prices[:-1]
-    return float((rets > 0).mean() * 100)
-
-def compute_moving_average(prices: NDArray[np.float64], window: int = 20) -> float:
-    """
-    Computes a simple moving average of the closing prices.
+    Computes the price metrics of several stocks in parallel, one stock per
+    thread.
 
     Args:
-        prices (NDArray[np.float64]): Array of closing prices.
-        window (int): Number of days for the moving average.
+        prices (NDArray[np.float32]): 2D array with the closing prices of one
+            stock per row, padded at the end to the longest row.
+        lengths (NDArray[np.int64]): Number of closing prices in each row.
 
     Returns:
-        float: Last value of the moving average.
+        NDArray[np.float64]: 2D array with one row per stock, holding the
+            values returned by compute_all followed by Bollinger %B and RSI.
     """
-    return float(pd.Series(prices).rolling(window).mean().iloc[-1])
-
-def compute_bollinger_pctB(prices: NDArray[np.float64], window: int = 20, n_std: int = 2) -> float:
+    out = np.empty((prices.shape[0], 9))
+    for i in prange(prices.shape[0]):
+        row = prices[i, :lengths[i]]
+        std_dev, large_changes, avg_daily, annual_vol, sharpe, max_dd, pos_days = compute_all(row, 10.0)
+        out[i, 0] = std_dev
+        out[i, 1] = large_changes
+        out[i, 2] = avg_daily
+        out[i, 3] = annual_vol
+        out[i, 4] = sharpe
+        out[i, 5] = max_dd
+        out[i, 6] = pos_days
+        out[i, 7] = compute_bollinger_pctB(row, 20, 2)
+        out[i, 8] = compute_rsi(row, 14)
+    return out
+
+def stock_result(file, metrics: dict) -> dict:
     """
-    Calculates the Bollinger %B indicator for the last price.
+    Builds the result row for a successfully processed file.
 
     Args:
-        prices (NDArray[np.float64]): Array of closing prices.
-        window (int): Number of days for the moving average and std.
-        n_std (int): Number of standard deviations for the bands.
+        file (FileStorage): An uploaded file from the request.
+        metrics (dict): The computed metrics.
 
     Returns:
-        float: Bollinger %B for the latest price.
+        dict: The stock symbol and chart link along with the metrics.
     """
-    s = pd.Series(prices)
-    mid = s.rolling(window).mean()
-    sd = s.rolling(window).std()
-    upper = mid + n_std * sd
-    lower = mid - n_std * sd
-    return float((prices[-1] - lower.iloc[-1]) / (upper.iloc[-1] - lower.iloc[-1]))
-
-def compute_rsi(prices: NDArray[np.float64], window: int = 14) -> float:
+    # File names are "<prefix><SYMBOL>.<ext>", possibly nested in a ZIP folder.
+    base_name = file.filename.rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
+    stock_symbol = base_name.rsplit(".", 1)[0][1:].upper()
+    chart_link = f"https://www.wsj.com/market-data/quotes/{stock_symbol}"
+    return {
+        "file_name": stock_symbol,
+        "chart_link": chart_link,
+        **metrics,
+    }
+
+def error_result(file, error: Exception) -> dict:
     """
-    Computes the Relative Strength Index (RSI) for the last price.
+    Builds the result row for a file that couldn't be processed.
 
     Args:
-        prices (NDArray[np.float64]): Array of closing prices.
-        window (int): Number of days for RSI calculation.
+        file (FileStorage): An uploaded file from the request.
+        error (Exception): The error raised while processing the file.
 
     Returns:
-        float: RSI value for the latest price.
+        dict: "Error" for every metric along with the error message.
     """
-    s = pd.Series(prices)
-    delta = s.diff()
-    gain = delta.clip(lower=0).ewm(alpha=1 / window).mean()
-    loss = -delta.clip(upper=0).ewm(alpha=1 / window).mean()
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    return float(rsi.iloc[-1])
-
-def compute_volume_spikes(volumes: NDArray[np.float64], threshold: float = 2.0) -> int:
+    return {
+        "file_name": file.filename,
+        "chart_link": "N/A",
+        "std_dev": "Error",
+        "large_changes": "Error",
+        "avg_daily_return": "Error",
+        "annual_volatility": "Error",
+        "sharpe_ratio": "Error",
+        "max_drawdown": "Error",
+        "positive_days": "Error",
+        "moving_average": "Error",
+        "bollinger_pctB": "Error",
+        "rsi": "Error",
+        "volume_spikes": "Error",
+        "error": str(error)
+    }
+
+def process_files(files) -> list:
     """
-    Counts days where trading volume exceeds a threshold times the average.
+    Reads uploaded CSVs and computes all metrics for them.
+
+    Metrics are cached by a digest of each file's contents, so re-uploading
+    an unchanged file skips parsing and computation entirely. Files with
+    identical contents in the same upload are parsed and computed once. The
+    price metrics of the remaining files are computed together by
+    compute_batch.
 
     Args:
-        volumes (NDArray[np.float64]): Array of daily volume values.
-        threshold (float): Multiplier of average volume for a spike.
+        files (list of FileStorage): The uploaded files from the request.
 
     Returns:
-        int: Number of volume spike days.
+        list: For each file, in order, the result row from stock_result or
+            error_result.
     """
-    avg_vol = volumes.mean()
-    return int((volumes > threshold * avg_vol).sum())
+    results = [None] * len(files)
+    parsed = []
+    # Indices of the files sharing each parsed file's contents.
+    duplicates = {}
+    for i, file in enumerate(files):
+        try:
+            data = file.stream.read()
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            with metrics_cache_lock:
+                metrics = metrics_cache.get(digest)
+                if metrics is not None:
+                    metrics_cache.move_to_end(digest)
+            if metrics is not None:
+                results[i] = stock_result(file, metrics)
+            elif digest in duplicates:
+                duplicates[digest].append(i)
+            else:
+                prices, volumes = load_stock_data_from_file(pa.BufferReader(data))
+                parsed.append((digest, prices, volumes))
+                duplicates[digest] = [i]
+        except Exception as e:
+            results[i] = error_result(file, e)
+
+    if not parsed:
+        return results
+
+    lengths = np.array([prices.size for _, prices, _ in parsed], dtype=np.int64)
+    batch = np.zeros((len(parsed), lengths.max()), dtype=np.float32)
+    for row, (_, prices, _) in enumerate(parsed):
+        batch[row, :prices.size] = prices
+    with compute_batch_lock:
+        price_metrics = compute_batch(batch, lengths)
+
+    for row, (digest, prices, volumes) in enumerate(parsed):
+        std_dev, large_changes, avg_daily, annual_vol, sharpe, max_dd, pos_days, bollinger_pctB, rsi = price_metrics[row]
+        moving_avg = compute_moving_average(prices)
+        vol_spikes = compute_volume_spikes(volumes)
+        metrics = {
+            "std_dev": std_dev,
+            "large_changes": int(large_changes),
+            "avg_daily_return": avg_daily,
+            "annual_volatility": annual_vol,
+            "sharpe_ratio": sharpe,
+            "max_drawdown": max_dd,
+            "positive_days": pos_days,
+            "moving_average": moving_avg,
+            "bollinger_pctB": bollinger_pctB,
+            "rsi": rsi,
+            "volume_spikes": vol_spikes,
+        }
+
+        with metrics_cache_lock:
+            metrics_cache[digest] = metrics
+            if len(metrics_cache) > METRICS_CACHE_SIZE:
+                metrics_cache.popitem(last=False)
+        for i in duplicates[digest]:
+            results[i] = stock_result(files[i], metrics)
+    return results
 
 
 @app.route("/", methods=["GET", "POST"])
@@ -224,56 +488,7 @@ def index():
         if not files or all(f.filename == "" for f in files):
             return jsonify({"error": "No files selected."}), 400
 
-        results = []
-        for file in files:
-            try:
-                prices, volumes = load_stock_data_from_file(file.stream)
-                std_dev = compute_standard_deviation(prices)
-                large_changes = detect_large_changes(prices)
-                avg_daily = compute_avg_daily_return(prices)
-                annual_vol = compute_annualized_volatility(prices)
-                sharpe = compute_sharpe_ratio(prices)
-                max_dd = compute_max_drawdown(prices)
-                pos_days = compute_percent_positive_days(prices)
-                moving_avg = compute_moving_average(prices)
-                bollinger_pctB = compute_bollinger_pctB(prices)
-                rsi = compute_rsi(prices)
-                vol_spikes = compute_volume_spikes(volumes)
-
-                stock_symbol = os.path.splitext(os.path.basename(file.filename))[0][1:].upper()
-                chart_link = f"https://www.wsj.com/market-data/quotes/{stock_symbol}"
-                results.append({
-                    "file_name": stock_symbol,
-                    "chart_link": chart_link,
-                    "std_dev": f"{std_dev:.2f}%",
-                    "large_changes": large_changes,
-                    "avg_daily_return": f"{avg_daily:.2f}%",
-                    "annual_volatility": f"{annual_vol:.2f}%",
-                    "sharpe_ratio": f"{sharpe:.2f}",
-                    "max_drawdown": f"{max_dd:.2f}%",
-                    "positive_days": f"{pos_days:.2f}%",
-                    "moving_average": f"{moving_avg:.2f}",
-                    "bollinger_pctB": f"{bollinger_pctB:.2f}",
-                    "rsi": f"{rsi:.2f}",
-                    "volume_spikes": vol_spikes,
-                })
-            except Exception as e:
-                results.append({
-                    "file_name": file.filename,
-                    "chart_link": "N/A",
-                    "std_dev": "Error",
-                    "large_changes": "Error",
-                    "avg_daily_return": "Error",
-                    "annual_volatility": "Error",
-                    "sharpe_ratio": "Error",
-                    "max_drawdown": "Error",
-                    "positive_days": "Error",
-                    "moving_average": "Error",
-                    "bollinger_pctB": "Error",
-                    "rsi": "Error",
-                    "volume_spikes": "Error",
-                    "error": str(e)
-                })
+        results = process_files(files)
         if request.headers.get("X-Requested-With") == "XMLHttpRequest":
             return jsonify(results=results)
         return render_template("index.html", results=results)
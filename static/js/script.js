@@ -123,6 +123,11 @@ async function doUpload() {
     }
 }
 
+// Metrics arrive as raw numbers; undefined values (NaN/inf) arrive as null
+function formatNumber(value, suffix = '') {
+    return value === null ? 'N/A' : `${value.toFixed(2)}${suffix}`;
+}
+
 function appendResults(results) {
     results.forEach(r => {
         const link = r.chart_link !== 'N/A'
@@ -133,16 +138,16 @@ function appendResults(results) {
         const tr = document.createElement('tr');
         tr.innerHTML = `
             <td>${link}</td>
-            <td>${r.std_dev}</td>
+            <td>${formatNumber(r.std_dev, '%')}</td>
             <td>${r.large_changes}</td>
-            <td>${r.avg_daily_return}</td>
-            <td>${r.annual_volatility}</td>
-            <td>${r.sharpe_ratio}</td>
-            <td>${r.max_drawdown}</td>
-            <td>${r.positive_days}</td>
-            <td>${r.moving_average}</td>
-            <td>${r.bollinger_pctB}</td>
-            <td>${r.rsi}</td>
+            <td>${formatNumber(r.avg_daily_return, '%')}</td>
+            <td>${formatNumber(r.annual_volatility, '%')}</td>
+            <td>${formatNumber(r.sharpe_ratio)}</td>
+            <td>${formatNumber(r.max_drawdown, '%')}</td>
+            <td>${formatNumber(r.positive_days, '%')}</td>
+            <td>${formatNumber(r.moving_average)}</td>
+            <td>${formatNumber(r.bollinger_pctB)}</td>
+            <td>${formatNumber(r.rsi)}</td>
             <td>${r.volume_spikes}</td>
             <td class="action-col"><button class="remove-btn">❌</button></td>
         `;